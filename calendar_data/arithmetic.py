@@ -0,0 +1,35 @@
+"""
+Gregorian and Unified calendar arithmetic on plain integers
+"""
+
+# Days elapsed before the first day of each Gregorian month, in a common year. Index 0 is unused.
+MONTH_OFFSET = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def is_leap(year: int) -> bool:
+    "True if Gregorian `year` is a leap year"
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+# Leap year flags for every year `datetime` supports (1..9999). Index 0 is unused.
+LEAP_YEARS = bytes(is_leap(year) for year in range(10000))
+
+
+def gregorian_yearday(year: int, month: int, day: int) -> int:
+    "Day of the year [1-366] of a valid Gregorian date"
+    return MONTH_OFFSET[month] + day + (month > 2 and LEAP_YEARS[year])
+
+
+def weekday_number(regular_day: int) -> int:
+    "Unified day of the week [1-6] of a regular day [1-360]. Weeks always start on a Firstday."
+    return (regular_day - 1) % 6 + 1
+
+
+def day_of_month(regular_day: int) -> int:
+    "Unified day of the month [1-18] of a regular day [1-360]"
+    return (regular_day - 1) % 18 + 1
+
+
+def month_number(regular_day: int) -> int:
+    "Unified month [1-20] of a regular day [1-360]. Regular days past the last month fall in month 20."
+    return min((regular_day - 1) // 18 + 1, 20)
@@ -3,22 +3,185 @@ Unified Day and Month names
 """
 from __future__ import annotations
 
-from collections import ChainMap
+import sys
 from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping
 
-from .definitions import UniMonth, UQ
+from .arithmetic import day_of_month, month_number, weekday_number
+from .definitions import UniDay, UniMonth, UniWeek, UQ
+
+# One `UQ` instance per (quarter, month) pair, shared by every month name table.
+_UQ_CACHE = MappingProxyType({(quarter, month): UQ(quarter, month) for quarter in range(1, 7) for month in range(6)})
+
+
+def _shared(table: dict[str | int, UniMonth]) -> Mapping[str | int, UniMonth]:
+    "Read-only month name table reusing the canonical `UQ` tuples and interned month names"
+    return MappingProxyType(
+        {key: UniMonth(sys.intern(month.name), _UQ_CACHE[month.numeric]) for key, month in table.items()}
+    )
+
+
+_WEEKDAY: Mapping[str, tuple[int, ...]] = MappingProxyType(
+    {
+        "Firstday": (1, 7, 13),
+        "Seconday": (2, 8, 14),
+        "Thirday": (3, 9, 15),
+        "Fourthday": (4, 10, 16),
+        "Fifthday": (5, 11, 17),
+        "Sixthday": (6, 12, 18),
+    }
+)
+
+# Short-format unified month names. Territorian and Austral variants use these same short names.
+_UNIFIED_MONTH_NAME_SHORT: Mapping[str | int, UniMonth] = _shared(
+    {
+        "Q1": UniMonth("Q10", UQ(1, 0)),
+        1: UniMonth("Q1A", UQ(1, 1)),
+        2: UniMonth("Q1B", UQ(1, 2)),
+        3: UniMonth("Q1C", UQ(1, 3)),
+        4: UniMonth("Q1D", UQ(1, 4)),
+        5: UniMonth("Q1E", UQ(1, 5)),
+        "Q2": UniMonth("Q20", UQ(2, 0)),
+        6: UniMonth("Q2A", UQ(2, 1)),
+        7: UniMonth("Q2B", UQ(2, 2)),
+        8: UniMonth("Q2C", UQ(2, 3)),
+        9: UniMonth("Q2D", UQ(2, 4)),
+        10: UniMonth("Q2E", UQ(2, 5)),
+        "Q3": UniMonth("Q30", UQ(3, 0)),
+        11: UniMonth("Q3A", UQ(3, 1)),
+        12: UniMonth("Q3B", UQ(3, 2)),
+        13: UniMonth("Q3C", UQ(3, 3)),
+        14: UniMonth("Q3D", UQ(3, 4)),
+        15: UniMonth("Q three E", UQ(3, 5)),
+        "Q4": UniMonth("Quarter four", UQ(4, 0)),
+        16: UniMonth("Q4A", UQ(4, 1)),
+        17: UniMonth("Q4B", UQ(4, 2)),
+        18: UniMonth("Q4C", UQ(4, 3)),
+        19: UniMonth("Q4D", UQ(4, 4)),
+        20: UniMonth("Q4E", UQ(4, 5)),
+        "YE": UniMonth("YE", UQ(5, 0)),
+        "LD": UniMonth("LD", UQ(6, 0)),
+    }
+)
+
+_UNIFIED_MONTH_NAME_LONG: Mapping[str | int, UniMonth] = _shared(
+    {
+        "Q1": UniMonth("Quarter one", UQ(1, 0)),
+        1: UniMonth("Quarter one-A", UQ(1, 1)),
+        2: UniMonth("Quarter one-B", UQ(1, 2)),
+        3: UniMonth("Quarter one-C", UQ(1, 3)),
+        4: UniMonth("Quarter one-D", UQ(1, 4)),
+        5: UniMonth("Quarter one-E", UQ(1, 5)),
+        "Q2": UniMonth("Quarter two", UQ(2, 0)),
+        6: UniMonth("Quarter two-A", UQ(2, 1)),
+        7: UniMonth("Quarter two-B", UQ(2, 2)),
+        8: UniMonth("Quarter two-C", UQ(2, 3)),
+        9: UniMonth("Quarter two-D", UQ(2, 4)),
+        10: UniMonth("Quarter two-E", UQ(2, 5)),
+        "Q3": UniMonth("Quarter three", UQ(3, 0)),
+        11: UniMonth("Quarter three-A", UQ(3, 1)),
+        12: UniMonth("Quarter three-B", UQ(3, 2)),
+        13: UniMonth("Quarter three-C", UQ(3, 3)),
+        14: UniMonth("Quarter three-D", UQ(3, 4)),
+        15: UniMonth("Quarter three-E", UQ(3, 5)),
+        "Q4": UniMonth("Quarter four", UQ(4, 0)),
+        16: UniMonth("Quarter four-A", UQ(4, 1)),
+        17: UniMonth("Quarter four-B", UQ(4, 2)),
+        18: UniMonth("Quarter four-C", UQ(4, 3)),
+        19: UniMonth("Quarter four-D", UQ(4, 4)),
+        20: UniMonth("Quarter four-E", UQ(4, 5)),
+        "YE": UniMonth("Year end", UQ(5, 0)),
+        "LD": UniMonth("Leap day", UQ(6, 0)),
+    }
+)
+
+_TERRITORIAN_MONTH_NAME_BASE: Mapping[str | int, UniMonth] = _shared(
+    {
+        1: UniMonth("Winter freeze", UQ(1, 1)),
+        2: UniMonth("Winter wane", UQ(1, 2)),
+        3: UniMonth("Winter end", UQ(1, 3)),
+        4: UniMonth("Spring low", UQ(1, 4)),
+        5: UniMonth("Spring break", UQ(1, 5)),
+        6: UniMonth("Spring height", UQ(2, 1)),
+        7: UniMonth("Spring wane", UQ(2, 2)),
+        8: UniMonth("Spring end", UQ(2, 3)),
+        9: UniMonth("Summer low", UQ(2, 4)),
+        10: UniMonth("Summer break", UQ(2, 5)),
+        11: UniMonth("Summer height", UQ(3, 1)),
+        12: UniMonth("Summer wane", UQ(3, 2)),
+        13: UniMonth("Summer end", UQ(3, 3)),
+        14: UniMonth("Autumn low", UQ(3, 4)),
+        15: UniMonth("Autumn fall", UQ(3, 5)),
+        16: UniMonth("Autumn lull|height", UQ(4, 1)),
+        17: UniMonth("Autumn wane", UQ(4, 2)),
+        18: UniMonth("Autumn end", UQ(4, 3)),
+        19: UniMonth("Winter low", UQ(4, 4)),
+        20: UniMonth("Winter chill", UQ(4, 5)),
+    }
+)
+
+_AUSTRAL_MONTH_NAME_BASE: Mapping[str | int, UniMonth] = _shared(
+    {
+        1: UniMonth("Summer height", UQ(1, 1)),
+        2: UniMonth("Summer wane", UQ(1, 2)),
+        3: UniMonth("Summer close", UQ(1, 3)),
+        4: UniMonth("Autumn start", UQ(1, 4)),
+        5: UniMonth("Autumn fall", UQ(1, 5)),
+        6: UniMonth("Autumn lull", UQ(2, 1)),
+        7: UniMonth("Autumn wane", UQ(2, 2)),
+        8: UniMonth("Autumn close", UQ(2, 3)),
+        9: UniMonth("Winter start", UQ(2, 4)),
+        10: UniMonth("Winter chill", UQ(2, 5)),
+        11: UniMonth("Winter lull", UQ(3, 1)),
+        12: UniMonth("Winter wane", UQ(3, 2)),
+        13: UniMonth("Winter close", UQ(3, 3)),
+        14: UniMonth("Spring start", UQ(3, 4)),
+        15: UniMonth("Spring break", UQ(3, 5)),
+        16: UniMonth("Spring run", UQ(4, 1)),
+        17: UniMonth("Spring wane", UQ(4, 2)),
+        18: UniMonth("Spring close", UQ(4, 3)),
+        19: UniMonth("Summer start", UQ(4, 4)),
+        20: UniMonth("Summer break", UQ(4, 5)),
+    }
+)
+
+# Long-format regional month names. Festive dates fall through to the Unified names.
+# Flattened once so every lookup is a single hash probe.
+TERRITORIAN_MONTH_NAME_LONG: Mapping[str | int, UniMonth] = MappingProxyType(
+    {**_UNIFIED_MONTH_NAME_LONG, **_TERRITORIAN_MONTH_NAME_BASE}
+)
+AUSTRAL_MONTH_NAME_LONG: Mapping[str | int, UniMonth] = MappingProxyType(
+    {**_UNIFIED_MONTH_NAME_LONG, **_AUSTRAL_MONTH_NAME_BASE}
+)
+
+
+# Festive dates and their short names. These are single-day months without a month number, only a name.
+FESTIVE_DAYS = (1, 92, 183, 274, 365, 366)
+FESTIVE_NAMES_SHORT = ("Q1", "Q2", "Q3", "Q4", "YE", "LD")
+FESTIVE_DAYS_SET = frozenset(FESTIVE_DAYS)
+# Index of each festive day in `FESTIVE_DAYS`, which is also its `UniWeek.number`.
+FESTIVE_INDEX = MappingProxyType({day: index for index, day in enumerate(FESTIVE_DAYS)})
+# `UniWeek.regular` flag by day of the year: 0=festive, 1=regular. Index 0 is unused.
+FESTIVE_DAYS_BITMAP = bytes(0 if day in FESTIVE_DAYS_SET else 1 for day in range(367))
+# Number of quarter festive days (Q1-Q4) before each day of the year. Index 0 is unused.
+FESTIVE_DAYS_BEFORE = bytes(sum(day > festive_day for festive_day in FESTIVE_DAYS[:4]) for day in range(367))
+# Festive short name by day of the year, None for regular days. Index 0 is unused.
+FESTIVE_SHORT_BY_YEARDAY: tuple[str | None, ...] = tuple(
+    FESTIVE_NAMES_SHORT[FESTIVE_INDEX[day]] if day in FESTIVE_DAYS_SET else None for day in range(367)
+)
 
 
-@dataclass(frozen=True)
 class FestiveDate:
     """
     Festive Date short names and their corresponding day of the year.
 
     These dates are considered single-day months but don't have a month number, only a name.
+    Kept for compatibility; same values as `FESTIVE_DAYS` and `FESTIVE_NAMES_SHORT`.
     """
 
-    DAY = (1, 92, 183, 274, 365, 366)
-    SHORT_NAME = ("Q1", "Q2", "Q3", "Q4", "YE", "LD")
+    DAY = FESTIVE_DAYS
+    SHORT_NAME = FESTIVE_NAMES_SHORT
 
 
 @dataclass(frozen=True)
@@ -27,134 +190,98 @@ class RegularDate:
     Regular date day and month names, and their corresponding day of the year.
     """
 
-    WEEKDAY: dict[str, tuple[int, ...]] = field(
-        default_factory=lambda: {
-            "Firstday": (1, 7, 13),
-            "Seconday": (2, 8, 14),
-            "Thirday": (3, 9, 15),
-            "Fourthday": (4, 10, 16),
-            "Fifthday": (5, 11, 17),
-            "Sixthday": (6, 12, 18),
-        }
+    # Tables are shared, read-only module constants, so instantiation never rebuilds them.
+    WEEKDAY: Mapping[str, tuple[int, ...]] = field(default_factory=lambda: _WEEKDAY)
+    UNIFIED_MONTH_NAME_SHORT: Mapping[str | int, UniMonth] = field(default_factory=lambda: _UNIFIED_MONTH_NAME_SHORT)
+    UNIFIED_MONTH_NAME_LONG: Mapping[str | int, UniMonth] = field(default_factory=lambda: _UNIFIED_MONTH_NAME_LONG)
+    TERRITORIAN_MONTH_NAME_BASE: Mapping[str | int, UniMonth] = field(
+        default_factory=lambda: _TERRITORIAN_MONTH_NAME_BASE
     )
+    AUSTRAL_MONTH_NAME_BASE: Mapping[str | int, UniMonth] = field(default_factory=lambda: _AUSTRAL_MONTH_NAME_BASE)
 
-    UNIFIED_MONTH_NAME_SHORT: dict[str | int, UniMonth] = field(
-        # Short-format unified month names. Territorian and Austral variants use these same short names.
-        default_factory=lambda: {
-            "Q1": UniMonth("Q10", UQ(1, 0)),
-            1: UniMonth("Q1A", UQ(1, 1)),
-            2: UniMonth("Q1B", UQ(1, 2)),
-            3: UniMonth("Q1C", UQ(1, 3)),
-            4: UniMonth("Q1D", UQ(1, 4)),
-            5: UniMonth("Q1E", UQ(1, 5)),
-            "Q2": UniMonth("Q20", UQ(2, 0)),
-            6: UniMonth("Q2A", UQ(2, 1)),
-            7: UniMonth("Q2B", UQ(2, 2)),
-            8: UniMonth("Q2C", UQ(2, 3)),
-            9: UniMonth("Q2D", UQ(2, 4)),
-            10: UniMonth("Q2E", UQ(2, 5)),
-            "Q3": UniMonth("Q30", UQ(3, 0)),
-            11: UniMonth("Q3A", UQ(3, 1)),
-            12: UniMonth("Q3B", UQ(3, 2)),
-            13: UniMonth("Q3C", UQ(3, 3)),
-            14: UniMonth("Q3D", UQ(3, 4)),
-            15: UniMonth("Q three E", UQ(3, 5)),
-            "Q4": UniMonth("Quarter four", UQ(4, 0)),
-            16: UniMonth("Q4A", UQ(4, 1)),
-            17: UniMonth("Q4B", UQ(4, 2)),
-            18: UniMonth("Q4C", UQ(4, 3)),
-            19: UniMonth("Q4D", UQ(4, 4)),
-            20: UniMonth("Q4E", UQ(4, 5)),
-            "YE": UniMonth("YE", UQ(5, 0)),
-            "LD": UniMonth("LD", UQ(6, 0)),
-        }
-    )
 
-    UNIFIED_MONTH_NAME_LONG: dict[str | int, UniMonth] = field(
-        default_factory=lambda: {
-            "Q1": UniMonth("Quarter one", UQ(1, 0)),
-            1: UniMonth("Quarter one-A", UQ(1, 1)),
-            2: UniMonth("Quarter one-B", UQ(1, 2)),
-            3: UniMonth("Quarter one-C", UQ(1, 3)),
-            4: UniMonth("Quarter one-D", UQ(1, 4)),
-            5: UniMonth("Quarter one-E", UQ(1, 5)),
-            "Q2": UniMonth("Quarter two", UQ(2, 0)),
-            6: UniMonth("Quarter two-A", UQ(2, 1)),
-            7: UniMonth("Quarter two-B", UQ(2, 2)),
-            8: UniMonth("Quarter two-C", UQ(2, 3)),
-            9: UniMonth("Quarter two-D", UQ(2, 4)),
-            10: UniMonth("Quarter two-E", UQ(2, 5)),
-            "Q3": UniMonth("Quarter three", UQ(3, 0)),
-            11: UniMonth("Quarter three-A", UQ(3, 1)),
-            12: UniMonth("Quarter three-B", UQ(3, 2)),
-            13: UniMonth("Quarter three-C", UQ(3, 3)),
-            14: UniMonth("Quarter three-D", UQ(3, 4)),
-            15: UniMonth("Quarter three-E", UQ(3, 5)),
-            "Q4": UniMonth("Quarter four", UQ(4, 0)),
-            16: UniMonth("Quarter four-A", UQ(4, 1)),
-            17: UniMonth("Quarter four-B", UQ(4, 2)),
-            18: UniMonth("Quarter four-C", UQ(4, 3)),
-            19: UniMonth("Quarter four-D", UQ(4, 4)),
-            20: UniMonth("Quarter four-E", UQ(4, 5)),
-            "YE": UniMonth("Year end", UQ(5, 0)),
-            "LD": UniMonth("Leap day", UQ(6, 0)),
-        }
-    )
+def _regular_day(day: int) -> int:
+    "Day of the year (1..366) not counting the festive days before it: the day number of regular weeks [1-360]"
+    return day - FESTIVE_DAYS_BEFORE[day]
 
-    TERRITORIAN_MONTH_NAME_BASE: dict[str | int, UniMonth] = field(
-        default_factory=lambda: {
-            1: UniMonth("Winter freeze", UQ(1, 1)),
-            2: UniMonth("Winter wane", UQ(1, 2)),
-            3: UniMonth("Winter end", UQ(1, 3)),
-            4: UniMonth("Spring low", UQ(1, 4)),
-            5: UniMonth("Spring break", UQ(1, 5)),
-            6: UniMonth("Spring height", UQ(2, 1)),
-            7: UniMonth("Spring wane", UQ(2, 2)),
-            8: UniMonth("Spring end", UQ(2, 3)),
-            9: UniMonth("Summer low", UQ(2, 4)),
-            10: UniMonth("Summer break", UQ(2, 5)),
-            11: UniMonth("Summer height", UQ(3, 1)),
-            12: UniMonth("Summer wane", UQ(3, 2)),
-            13: UniMonth("Summer end", UQ(3, 3)),
-            14: UniMonth("Autumn low", UQ(3, 4)),
-            15: UniMonth("Autumn fall", UQ(3, 5)),
-            16: UniMonth("Autumn lull|height", UQ(4, 1)),
-            17: UniMonth("Autumn wane", UQ(4, 2)),
-            18: UniMonth("Autumn end", UQ(4, 3)),
-            19: UniMonth("Winter low", UQ(4, 4)),
-            20: UniMonth("Winter chill", UQ(4, 5)),
-        }
-    )
 
-    AUSTRAL_MONTH_NAME_BASE: dict[str | int, UniMonth] = field(
-        default_factory=lambda: {
-            1: UniMonth("Summer height", UQ(1, 1)),
-            2: UniMonth("Summer wane", UQ(1, 2)),
-            3: UniMonth("Summer close", UQ(1, 3)),
-            4: UniMonth("Autumn start", UQ(1, 4)),
-            5: UniMonth("Autumn fall", UQ(1, 5)),
-            6: UniMonth("Autumn lull", UQ(2, 1)),
-            7: UniMonth("Autumn wane", UQ(2, 2)),
-            8: UniMonth("Autumn close", UQ(2, 3)),
-            9: UniMonth("Winter start", UQ(2, 4)),
-            10: UniMonth("Winter chill", UQ(2, 5)),
-            11: UniMonth("Winter lull", UQ(3, 1)),
-            12: UniMonth("Winter wane", UQ(3, 2)),
-            13: UniMonth("Winter close", UQ(3, 3)),
-            14: UniMonth("Spring start", UQ(3, 4)),
-            15: UniMonth("Spring break", UQ(3, 5)),
-            16: UniMonth("Spring run", UQ(4, 1)),
-            17: UniMonth("Spring wane", UQ(4, 2)),
-            18: UniMonth("Spring close", UQ(4, 3)),
-            19: UniMonth("Summer start", UQ(4, 4)),
-            20: UniMonth("Summer break", UQ(4, 5)),
-        }
-    )
+def _uniweek(day: int) -> UniWeek:
+    "Unified week tuple for a day of the year (1..366)"
+    regular = FESTIVE_DAYS_BITMAP[day]
+    if not regular:
+        return UniWeek(regular, FESTIVE_INDEX[day], day)
+    regular_day = _regular_day(day)
+    return UniWeek(regular, weekday_number(regular_day), regular_day)
+
+
+def _month_key(day: int) -> str | int:
+    "Month table key for a day of the year (1..366): festive short name, or regular month number [1-20]"
+    return FESTIVE_SHORT_BY_YEARDAY[day] or month_number(_regular_day(day))
+
+
+def _uniday(day: int, long: bool) -> UniDay:
+    "Unified day tuple for a day of the year (1..366), with the long or short (e.g. 'D5') weekday name"
+    weekday = UNIWEEK_BY_YEARDAY[day]
+    if not weekday.regular:
+        return FESTIVE_UNIDAY[weekday.number]
+    month_day = day_of_month(weekday.yearday)
+    return UNIDAY_LONG_BY_NUMBERS[weekday.number, month_day] if long else UNIDAY_SHORT_BY_MONTHDAY[month_day]
+
+
+def _by_yearday(table: Mapping[str | int, UniMonth]) -> tuple[UniMonth | None, ...]:
+    "Resolve a month name table into a tuple indexed directly by day of the year. Index 0 is unused."
+    return (None,) + tuple(table[_month_key(day)] for day in range(1, 367))
 
-    @property
-    def TERRITORIAN_MONTH_NAME_LONG(self) -> dict[str, tuple[int, ...]]:
-        return ChainMap(self.TERRITORIAN_MONTH_NAME_BASE, self.UNIFIED_MONTH_NAME_LONG)
 
-    @property
-    def AUSTRAL_MONTH_NAME_LONG(self) -> dict[str, tuple[int, ...]]:
-        return ChainMap(self.AUSTRAL_MONTH_NAME_BASE, self.UNIFIED_MONTH_NAME_LONG)
+def _by_month_number(table: Mapping[str | int, UniMonth]) -> tuple[UniMonth | None, ...]:
+    "Regular months [1-20] of a month name table as a tuple indexed by month number. Index 0 is unused."
+    return (None,) + tuple(table[number] for number in range(1, 21))
+
+
+# Regular month names by month number [1-20]. Festive months are only in the dict tables, keyed by short name.
+UNI_SHORT_BY_MONTH = _by_month_number(_UNIFIED_MONTH_NAME_SHORT)
+UNI_LONG_BY_MONTH = _by_month_number(_UNIFIED_MONTH_NAME_LONG)
+SWT_LONG_BY_MONTH = _by_month_number(TERRITORIAN_MONTH_NAME_LONG)
+AUS_LONG_BY_MONTH = _by_month_number(AUSTRAL_MONTH_NAME_LONG)
+
+# Weekday name by weekday number [1-6] or day of the month [1-18]. Index 0 is unused.
+WEEKDAY_BY_DAYNUM: tuple[str, ...] = tuple(
+    "".join(name for name, numbers in _WEEKDAY.items() if number in numbers) for number in range(19)
+)
+
+# Every distinct `UniDay`, built once and shared: festive days by `UniWeek.number`, regular days by day of the month
+# [1-18] (short names), or by (weekday number, day of the month) (long names).
+FESTIVE_UNIDAY: tuple[UniDay, ...] = tuple(UniDay(name, 0) for name in FESTIVE_NAMES_SHORT)
+UNIDAY_SHORT_BY_MONTHDAY: tuple[UniDay | None, ...] = (None,) + tuple(
+    UniDay(sys.intern(f"D{month_day}"), month_day) for month_day in range(1, 19)
+)
+UNIDAY_LONG_BY_NUMBERS: Mapping[tuple[int, int], UniDay] = MappingProxyType(
+    {
+        (number, month_day): UniDay(WEEKDAY_BY_DAYNUM[number], month_day)
+        for number in range(1, 19)
+        for month_day in range(1, 19)
+    }
+)
+
+# Week and month for every day of the year, resolved once at import. Index 0 is unused.
+UNIWEEK_BY_YEARDAY: tuple[UniWeek | None, ...] = (None,) + tuple(_uniweek(day) for day in range(1, 367))
+UNIDAY_LONG_BY_YEARDAY: tuple[UniDay | None, ...] = (None,) + tuple(_uniday(day, True) for day in range(1, 367))
+UNIDAY_SHORT_BY_YEARDAY: tuple[UniDay | None, ...] = (None,) + tuple(_uniday(day, False) for day in range(1, 367))
+UNI_SHORT_BY_YEARDAY = _by_yearday(_UNIFIED_MONTH_NAME_SHORT)
+UNI_LONG_BY_YEARDAY = _by_yearday(_UNIFIED_MONTH_NAME_LONG)
+SWT_LONG_BY_YEARDAY = _by_yearday(TERRITORIAN_MONTH_NAME_LONG)
+AUS_LONG_BY_YEARDAY = _by_yearday(AUSTRAL_MONTH_NAME_LONG)
+
+# All of the above in a single row per day of the year:
+# (UniWeek, long UniDay, short UniDay, Unified short month, Unified long month, SWT long month, Austral long month)
+YEARDAY_TABLE: tuple[tuple, ...] = tuple(
+    zip(
+        UNIWEEK_BY_YEARDAY,
+        UNIDAY_LONG_BY_YEARDAY,
+        UNIDAY_SHORT_BY_YEARDAY,
+        UNI_SHORT_BY_YEARDAY,
+        UNI_LONG_BY_YEARDAY,
+        SWT_LONG_BY_YEARDAY,
+        AUS_LONG_BY_YEARDAY,
+    )
+)
@@ -2,7 +2,21 @@
 Text representation for Unified Dates, styles (long, short) and their variants.
 """
 
+from __future__ import annotations
+
 from enum import Enum, unique
+from functools import lru_cache, partial
+from typing import Callable, Sequence
+
+from calendar_data.arithmetic import day_of_month, month_number
+from calendar_data.definitions import UniMonth, UnifiedDateType
+from calendar_data.names import (
+    AUS_LONG_BY_MONTH,
+    SWT_LONG_BY_MONTH,
+    UNI_LONG_BY_MONTH,
+    UNI_SHORT_BY_MONTH,
+    WEEKDAY_BY_DAYNUM,
+)
 
 
 @unique
@@ -20,3 +34,47 @@ class Style(Enum):
     LONG = "Long"  # "LongDayName WeekdayNumber, LongMonthName YearNumber" e.g. "Thirday 3, Quarter two-B 7620"
     SHORT = "Short"  # "ShortDayName WeekdayNumber, ShortMonthName YearNumber" e.g "D3 3, Q2B 7620"
     ISO = "ISO"  # ISO 8601U "Year-QuarterMonth-day" e.g. 7620-22-03 (Output is the same for all three variants)
+
+
+def _format_iso(date: UnifiedDateType) -> str:
+    "ISO 8601U: the output is the same for all variants"
+    _, day, month, year = date
+    quarter, quarter_month = month.numeric
+    return "%s-%d%d-%02d" % (year, quarter, quarter_month, day.number)
+
+
+def _format_named(date: UnifiedDateType, months: Sequence[UniMonth | None], short: bool) -> str:
+    "Long or Short representation, taking regular month names from `months`, indexed by month number"
+    regular, weekday_number, yearday = date.weekday
+    if not regular:
+        return "%s %s" % (date.month.name, date.year)  # festive
+
+    month_day = day_of_month(yearday)
+    month_name = months[month_number(yearday)].name
+    if short:
+        return "D%d %d, %s %s" % (month_day, month_day, month_name, date.year)
+    return "%s %02d, %s %s" % (WEEKDAY_BY_DAYNUM[weekday_number], month_day, month_name, date.year)
+
+
+# Non-unified variants don't have a short-format month name; they use the same name as the Unified variant.
+_FORMATTERS: dict[tuple[Variant, Style], Callable[[UnifiedDateType], str]] = {
+    (Variant.UNI, Style.LONG): partial(_format_named, months=UNI_LONG_BY_MONTH, short=False),
+    (Variant.UNI, Style.SHORT): partial(_format_named, months=UNI_SHORT_BY_MONTH, short=True),
+    (Variant.UNI, Style.ISO): _format_iso,
+    (Variant.SWT, Style.LONG): partial(_format_named, months=SWT_LONG_BY_MONTH, short=False),
+    (Variant.SWT, Style.SHORT): partial(_format_named, months=UNI_SHORT_BY_MONTH, short=True),
+    (Variant.SWT, Style.ISO): _format_iso,
+    (Variant.AUS, Style.LONG): partial(_format_named, months=AUS_LONG_BY_MONTH, short=False),
+    (Variant.AUS, Style.SHORT): partial(_format_named, months=UNI_SHORT_BY_MONTH, short=True),
+    (Variant.AUS, Style.ISO): _format_iso,
+}
+
+
+@lru_cache(maxsize=4096)
+def format_unidate(date: UnifiedDateType, variant: Variant, style: Style | str) -> str:
+    """
+    Format a Unified date tuple according to a regional variant and representation style.
+
+    Invalid or unknown styles are formatted as `Style.LONG`. Results are cached, as dates are immutable.
+    """
+    return _FORMATTERS.get((variant, style), _FORMATTERS[variant, Style.LONG])(date)
@@ -11,11 +11,20 @@
 """
 import random
 from unidate import UnifiedDate
-from copy import deepcopy
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pytest import fixture, raises
 from typing import NamedTuple
-from unidate import InvalidUnifiedDateValue, Variant
+from unidate import InvalidUnifiedDateValue, UniDay, UniWeek, Variant
+from unidate import _reverse_unidate_core, _unify_core, _year_isodates
+from presentation.styling import format_unidate
+from calendar_data.names import (
+    AUS_LONG_BY_YEARDAY,
+    SWT_LONG_BY_YEARDAY,
+    UNI_LONG_BY_YEARDAY,
+    UNI_SHORT_BY_YEARDAY,
+    UNIDAY_LONG_BY_YEARDAY,
+    UNIDAY_SHORT_BY_YEARDAY,
+)
 
 
 YEAR_OFFSET = 5600  # Unified Calendar sets "Year zero" at the invention of writing, this many years "AD"
@@ -44,9 +53,18 @@ def instance():
     return UnifiedDate()
 
 
+# Leap year flags for the '0001 AD' - '4399 AD' range used by these tests
+_LEAP = bytes(1 if (y % 4 == 0 and (y % 100 or (y % 100 == y % 400 == 0))) else 0 for y in range(4400))
+
+
 def is_leap(year):
     "Aux function to calculate if Gregorian year is a leap year"
-    return year if (year % 4 == 0 and (year % 100 or (year % 100 == year % 400 == 0))) else None
+    return year if _LEAP[year] else None
+
+
+def nth_day(year, day):
+    "Aux function to get the ISO Gregorian date of the Nth day of the year"
+    return (date(year, 1, 1) + timedelta(days=day - 1)).isoformat()
 
 
 class TestInstance_OK:
@@ -93,12 +111,21 @@ class TestInstance_OK:
         u = fixed_date
         _str = u.__str__()
 
-        assert u.__repr__() == _str
+        assert u.__repr__() == "UnifiedDate('2019-12-30')"
         assert "2019-12-30" in _str
         assert "7619-45-18" in _str
         assert "Winter chill" in _str
         assert "Summer break" in _str
 
+    def test_unify_normalises_non_padded_dates(self, fixed_date):
+        "`unify` accepts dates without zero padding and stores them in canonical ISO format."
+        u = fixed_date
+
+        assert u.unify("2019-1-1") == UnifiedDate("2019-01-01").unified_date
+        assert u.gregorian_date == "2019-01-01"
+        assert u.unify("2019-12-3") == UnifiedDate("2019-12-03").unified_date
+        assert u.gregorian_date == "2019-12-03"
+
     def test_same_Nth_day_always_repeats(self, gregorian_years):
         "The same day number in any year (e.g. the 154th day) always falls on the same Unified date."
         u = UnifiedDate()
@@ -114,8 +141,7 @@ class TestInstance_OK:
 
             for year in gregorian_years:
                 # get unified dates for the same Nth day of the year in different years
-                _date = datetime.strptime("{} {}".format(year, day), "%Y %j")  # Nth day to Gregorian date
-                unidate_years.append(u.unify(_date.strftime("%Y-%m-%d")))  # Unify date and append it
+                unidate_years.append(u.unify(nth_day(year, day)))  # Unify Nth day's Gregorian date and append it
 
             for this_date in unidate_years:
                 # Collect unified date properties for every unidate/year.
@@ -181,16 +207,112 @@ class TestInstance_OK:
                 assert u.unified_date.month.numeric.month == 0
                 assert u.unified_date.year == unified_year
 
+    def test_yearday_tables_match_get_uniday_and_get_unimonth(self, instance):
+        "Precomputed tables give the same days and months as `get_uniday`/`get_unimonth` for every day of the year."
+        for day in range(1, 367):
+            weekday = instance.get_uniweek(day)
+            assert UNIDAY_LONG_BY_YEARDAY[day] == instance.get_uniday(weekday, "Long")
+            assert UNIDAY_SHORT_BY_YEARDAY[day] == instance.get_uniday(weekday, "Short")
+            assert UNI_SHORT_BY_YEARDAY[day] == instance.get_unimonth(weekday, Variant.UNI, "Short")
+            assert UNI_LONG_BY_YEARDAY[day] == instance.get_unimonth(weekday, Variant.UNI, "Long")
+            assert SWT_LONG_BY_YEARDAY[day] == instance.get_unimonth(weekday, Variant.SWT, "Long")
+            assert AUS_LONG_BY_YEARDAY[day] == instance.get_unimonth(weekday, Variant.AUS, "Long")
+
+    def test_get_uniday_with_unknown_week_number_has_no_name(self, instance):
+        "Week numbers outside [1-18] give a day with an empty name, as before the lookup tables."
+        for number in (0, 19, 25, -1):
+            assert instance.get_uniday(UniWeek(1, number, 30), "Long") == UniDay("", 12)
+
+    def test_get_unimonth_before_first_day_is_first_month(self, instance):
+        "Regular days in [-16, 0] fall in the first month, as before the lookup tables."
+        for yearday in (0, -1, -16):
+            assert instance.get_unimonth(UniWeek(1, 1, yearday), Variant.UNI, "Short") == ("Q1A", (1, 1))
+
+    def test_unify_batch_matches_unify(self, fixed_date, gregorian_years):
+        "`unify_batch` returns the same Unified dates as calling `unify` on each date, without changing the instance."
+        u = fixed_date
+        assert u.unify_batch(["2019-12-30", "2020-01-01", "2020-12-31"]) == [
+            ((1, 6, 360), ("Sixthday", 18), ("Quarter four-E", (4, 5)), 7619),
+            ((0, 0, 1), ("Q1", 0), ("Quarter one", (1, 0)), 7620),
+            ((0, 5, 366), ("LD", 0), ("Leap day", (6, 0)), 7620),
+        ]
+        assert u.unify_batch(["2019-12-30", "2020-02-29"], "Short") == [
+            ((1, 6, 360), ("D18", 18), ("Q4E", (4, 5)), 7619),
+            ((1, 5, 59), ("D5", 5), ("Q1D", (1, 4)), 7620),
+        ]
+
+        _dates = [f"{year}-{month:02}-{day:02}" for year in gregorian_years for month in (1, 3, 12) for day in (1, 30)]
+
+        for style in ("Long", "Short"):
+            _batch = u.unify_batch(_dates, style=style)
+            assert u.gregorian_date == "2019-12-30"
+            assert _batch == [UnifiedDate(_date, style).unified_date for _date in _dates]
+
+    def test_unify_batch_accepts_same_dates_as_unify(self, fixed_date):
+        "`unify_batch` normalises dates without zero padding and rejects other ISO 8601 forms, like `unify`."
+        assert fixed_date.unify_batch(["2019-1-1"]) == [UnifiedDate("2019-01-01").unified_date]
+        for bad_date in ("20191230", "2019-W01-1"):
+            with raises(ValueError):
+                fixed_date.unify_batch(["2019-12-30", bad_date])
+
+    def test_unify_range_matches_unify_batch(self, fixed_date, gregorian_years):
+        "`unify_range` returns one Unified date per day, the same as `unify_batch` for the same dates."
+        u = fixed_date
+
+        for year in gregorian_years:
+            _dates = [nth_day(year, day) for day in range(1, 367 if is_leap(year) else 366)]
+            assert u.unify_range(f"{year}-01-01", f"{year}-12-31", "Short") == u.unify_batch(_dates, "Short")
+        assert u.unify_range("2020-01-02", "2020-01-01") == []
+        assert u.gregorian_date == "2019-12-30"
+
+    def test_unify_range_accepts_same_dates_as_unify(self, fixed_date):
+        "`unify_range` bounds are accepted in the same formats as `unify` dates."
+        assert fixed_date.unify_range("2019-1-1", "2019-1-3") == fixed_date.unify_batch(
+            ["2019-01-01", "2019-01-02", "2019-01-03"]
+        )
+        for bad_date in ("20191230", "2019-W01-1"):
+            with raises(ValueError):
+                fixed_date.unify_range("2019-12-01", bad_date)
+            with raises(ValueError):
+                fixed_date.unify_range(bad_date, "2019-12-31")
+
+    def test_clear_cache_keeps_results(self, fixed_date):
+        "`clear_cache` empties every shared cache, and results after it are the same as before it."
+        _caches = (_unify_core, _reverse_unidate_core, _year_isodates, format_unidate)
+        _before = fixed_date.unify("2020-02-29"), fixed_date.format_date(style="ISO")
+        fixed_date.reverse_unidate("7620-45-18")
+        _year_isodates(2020)
+        assert all(cached.cache_info().currsize for cached in _caches)
+
+        UnifiedDate.clear_cache()
+        assert [cached.cache_info().currsize for cached in _caches] == [0, 0, 0, 0]
+        assert (fixed_date.unify("2020-02-29"), fixed_date.format_date(style="ISO")) == _before
+
+    def test_reverse_unidate_batch_matches_reverse_unidate(self, fixed_date, gregorian_years):
+        "`reverse_unidate_batch` returns the same Gregorian dates as `reverse_unidate`, without changing the instance."
+        u = fixed_date
+        _dates = [
+            UnifiedDate(f"{year}-{month:02}-01").format_date(style="ISO")
+            for year in gregorian_years
+            for month in (1, 6)
+        ]
+
+        _batch = u.reverse_unidate_batch(_dates)
+        assert u.gregorian_date == "2019-12-30"
+        assert _batch == [UnifiedDate().reverse_unidate(_date) for _date in _dates]
+        assert [u.reverse_unidate(_date, update_state=False) for _date in _dates] == _batch
+        assert u.gregorian_date == "2019-12-30"
+
     def test_reverse_year_works(self, fixed_date, instance, today):
         "function `reverse_year` returns correct Gregorian year from Unified year"
         # for known date
         assert fixed_date.gregorian_date == "2019-12-30"
-        _uy = deepcopy(fixed_date.unified_date.year)
+        _uy = fixed_date.unified_date.year
         _gy = fixed_date.reverse_year(_uy)
         assert _gy == 2019
         # for system date
         _this_year, *_ = today.split("-")
-        _uy = deepcopy(instance.unified_date.year)
+        _uy = instance.unified_date.year
         _gy = instance.reverse_year(_uy)
         assert _gy == int(_this_year)
 
@@ -201,11 +323,19 @@ class TestInstance_OK:
             _range = range(1, 367) if is_leap(year) else range(1, 366)
 
             for day in _range:
-                _ = _to_uni.unify(datetime.strptime(f"{year}-{day:03}", "%Y-%j").strftime("%Y-%m-%d"))
-                _original = deepcopy(_to_uni)
+                _ = _to_uni.unify(nth_day(year, day))
+                _original_gregorian = _to_uni.gregorian_date  # str, immutable: no copy needed
                 _iso_uni = _to_uni.format_date(style="ISO")
                 _greg_from_uni = _to_uni.reverse_unidate(_iso_uni)
-                assert _greg_from_uni.strftime("%Y-%m-%d") == _original.gregorian_date
+                assert _greg_from_uni.strftime("%Y-%m-%d") == _original_gregorian
+
+    def test_print_festive_prints_leap_day_only_in_leap_years(self, capsys):
+        "A common year has 5 festive days, a leap year has 6."
+        for user_date, festive_days in (("2019-06-01", 5), ("2020-06-01", 6), ("9999-06-01", 5)):
+            UnifiedDate(user_date).print_festive()
+            printed = capsys.readouterr().out
+            assert printed.count("_" * 50) == festive_days
+            assert f"{int(user_date[:4]) + 1}-01-01" not in printed
 
 
 class TestInstance_Errors:
@@ -214,6 +344,9 @@ class TestInstance_Errors:
     def test_instance_raises_exception_with_invalid_date(self):
         with raises(ValueError):
             assert UnifiedDate("not a date")
+        for bad_date in ("20191230", "2019-W01-1"):  # valid for `date.fromisoformat` on 3.11+, but not YYYY-MM-DD
+            with raises(ValueError):
+                assert UnifiedDate(bad_date)
 
     def test_get_uniweek_raises_exception_with_invalid_days(self, instance):
         for bad_day in (0, 367, 543):
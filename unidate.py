@@ -36,13 +36,183 @@ from __future__ import annotations
 __author__ = "R.M. Beristain"
 __version__ = "1.1.1"
 
-from datetime import datetime, timedelta
-from math import trunc
+import logging
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Iterable
 
+from calendar_data.arithmetic import LEAP_YEARS, day_of_month, gregorian_yearday, month_number
 from calendar_data.definitions import UniDay, UniWeek, UniMonth, UQ, UnifiedDateType
-from calendar_data.names import FestiveDate, RegularDate
+from calendar_data.names import (
+    AUS_LONG_BY_MONTH,
+    AUSTRAL_MONTH_NAME_LONG,
+    FESTIVE_DAYS,
+    FESTIVE_NAMES_SHORT,
+    FESTIVE_UNIDAY,
+    SWT_LONG_BY_MONTH,
+    TERRITORIAN_MONTH_NAME_LONG,
+    UNI_LONG_BY_MONTH,
+    UNI_SHORT_BY_MONTH,
+    UNIDAY_LONG_BY_NUMBERS,
+    UNIDAY_SHORT_BY_MONTHDAY,
+    UNIWEEK_BY_YEARDAY,
+    YEARDAY_TABLE,
+    RegularDate,
+)
 from exceptions import InvalidUnifiedDateValue
-from presentation.styling import Style, Variant
+from presentation.styling import Style, Variant, format_unidate
+
+logger = logging.getLogger(__name__)
+
+# ISO 8601U date: Year-QuarterMonth-Day, e.g. '7620-22-03'. Quarter and month are one digit each.
+_ISO8601U = re.compile(r"(\d+)-(\d)(\d)-(\d{1,2})")
+
+# Case-insensitive lookup of `Variant` and `Style` members by value, used by `UnifiedDate.__check_*`.
+_VARIANT_BY_NAME = {this.value.upper(): this for this in Variant}
+_STYLE_BY_NAME = {this.value.upper(): this for this in Style}
+
+
+@lru_cache(maxsize=4096)
+def _unify_core(
+    user_date: str, style: Style | str
+) -> tuple[datetime, UnifiedDateType, UnifiedDateType, UnifiedDateType]:
+    """
+    Convert a Gregorian ISO date to Unified, SWT and Austral dates.
+
+    This is the stateless part of `UnifiedDate.unify`. Results are immutable, so they are cached and shared between
+    instances. `style` must already be checked by `UnifiedDate.__check_style`.
+
+    Returns
+    -------
+    - (first day of the Gregorian year, Unified date, SWT date, Austral date)
+    """
+    try:
+        udate = date.fromisoformat(user_date)
+        if udate.isoformat() != user_date:
+            # Python 3.11+ also parses basic and week dates ('20191230', '2019-W01-1'); only YYYY-MM-DD is cached.
+            raise ValueError(user_date)
+    except ValueError:
+        msg = f"Date {user_date!r} must be in ISO-8601 format (YYYY-MM-DD)"
+        logger.debug(msg)
+        raise ValueError(msg)
+
+    year_start = datetime(udate.year, 1, 1)
+    days = gregorian_yearday(udate.year, udate.month, udate.day)
+    year = udate.year + 5600
+    uni_weekday, day_long, day_short, month_short, month_long, month_swt, month_aus = YEARDAY_TABLE[days]
+    # Long day names only if explicitely requested, else Short. Same rule as `get_uniday`.
+    uni_day = day_long if style == Style.LONG else day_short
+    # Short month names only if explicitely requested, else Long. Same rule as `get_unimonth`.
+    uni_month = month_short if style == Style.SHORT else month_long
+
+    return (
+        year_start,
+        UnifiedDateType(uni_weekday, uni_day, uni_month, year),
+        UnifiedDateType(uni_weekday, uni_day, month_swt, year),
+        UnifiedDateType(uni_weekday, uni_day, month_aus, year),
+    )
+
+
+def _parse_isodate(user_date: str) -> date:
+    """
+    Parse a Gregorian 'YYYY-MM-DD' date, also without zero padding (e.g. '2019-1-1').
+
+    The other ISO 8601 forms `date.fromisoformat` takes on Python 3.11+ ('20191230', '2019-W01-1') are rejected.
+    """
+    try:
+        udate = date.fromisoformat(user_date)
+        if udate.isoformat() == user_date:
+            return udate
+    except ValueError:
+        pass
+
+    try:
+        return datetime.strptime(user_date, "%Y-%m-%d").date()
+    except ValueError:
+        msg = f"Date {user_date!r} must be in ISO-8601 format (YYYY-MM-DD)"
+        logger.debug(msg)
+        raise ValueError(msg)
+
+
+def _unify_lenient(
+    user_date: str, style: Style | str
+) -> tuple[str, tuple[datetime, UnifiedDateType, UnifiedDateType, UnifiedDateType]]:
+    """
+    `_unify_core`, also accepting dates without zero padding (e.g. '2019-1-1').
+
+    Canonical dates go straight to the cache; anything else is normalised with `strptime` only after the cache
+    rejected it, so each date is cached once.
+
+    Returns
+    -------
+    - (canonical 'YYYY-MM-DD' date, `_unify_core` result)
+    """
+    try:
+        return user_date, _unify_core(user_date, style)
+    except ValueError:
+        user_date = _parse_isodate(user_date).isoformat()
+        return user_date, _unify_core(user_date, style)
+
+
+@lru_cache(maxsize=8)
+def _year_isodates(year: int) -> tuple[str, ...]:
+    """
+    ISO dates of the 366 days starting on January 1st of a Gregorian year, shared by the calendar printers.
+
+    In common years the last entry is January 1st of the following year, except in 9999 (there's no year 10000).
+    """
+    first_day = date(year, 1, 1).toordinal()
+    last_day = min(first_day + 365, date.max.toordinal())
+    return tuple(date.fromordinal(day).isoformat() for day in range(first_day, last_day + 1))
+
+
+def _reverse_year(unified_year: int) -> int:
+    "Stateless `UnifiedDate.reverse_year`"
+    if unified_year is None:
+        raise InvalidUnifiedDateValue("Invalid year value: None")
+
+    try:
+        unified_year = int(unified_year)
+        if unified_year >= 0:
+            return unified_year - 5600
+        raise InvalidUnifiedDateValue("Cannot convert Unified prehistoric dates.")
+    except ValueError:
+        raise InvalidUnifiedDateValue(f"{unified_year!r} - Not a valid year.")
+    return None
+
+
+@lru_cache(maxsize=2048)
+def _reverse_unidate_core(u_date: str) -> datetime:
+    """
+    Convert an ISO 8601U Unified date string to a Gregorian datetime.
+
+    This is the stateless part of `UnifiedDate.reverse_unidate`. Results are immutable, so they are cached.
+    """
+    user_date = u_date
+    try:
+        match = _ISO8601U.fullmatch(user_date.strip())
+    except AttributeError as err:
+        logger.debug("Expected a string: %s", err)
+        raise
+    if match is None:
+        logger.debug("Expected an ISO-8601U (YYYY-QM-DD) date: %s", user_date)
+        raise InvalidUnifiedDateValue(f"Not an ISO-8601U date: {user_date!r}")
+    _year, _quarter, _month, _day = map(int, match.groups())
+
+    _gyear = _reverse_year(_year)  # Gregorian year
+
+    if _month == 0:
+        if _quarter < 1 or _quarter > 6:
+            raise InvalidUnifiedDateValue(f"Not an ISO-8601U date: {user_date!r}")
+        _yearday = FESTIVE_DAYS[_quarter - 1]
+    else:
+        _julian = (90 * (_quarter - 1)) + (18 * (_month - 1)) + _day
+        if _julian < 1 or _julian > 366:
+            raise InvalidUnifiedDateValue(f"Not an ISO-8601U date: {user_date!r}")
+        _yearday = _julian + _quarter  # one festive day precedes each quarter
+
+    return datetime.fromordinal(date(_gyear, 1, 1).toordinal() + _yearday - 1)
 
 
 class UnifiedDate:
@@ -84,16 +254,27 @@ class UnifiedDate:
     _UNIFIED_MONTH_NAME_LONG = _regular_date.UNIFIED_MONTH_NAME_LONG
     _TERRITORIAN_MONTH_NAME_BASE = _regular_date.TERRITORIAN_MONTH_NAME_BASE
     _AUSTRAL_MONTH_NAME_BASE = _regular_date.AUSTRAL_MONTH_NAME_BASE
-    _TERRITORIAN_MONTH_NAME_LONG = _regular_date.TERRITORIAN_MONTH_NAME_LONG
-    _AUSTRAL_MONTH_NAME_LONG = _regular_date.AUSTRAL_MONTH_NAME_LONG
+    _TERRITORIAN_MONTH_NAME_LONG = TERRITORIAN_MONTH_NAME_LONG
+    _AUSTRAL_MONTH_NAME_LONG = AUSTRAL_MONTH_NAME_LONG
 
     del _regular_date
 
-    _year_start: datetime | None = None  # datetime object containing first day of date's year
-    unified_date: UnifiedDateType | None = None
-    swt_date: UnifiedDateType | None = None
-    austral_date: UnifiedDateType | None = None
-    gregorian_date: datetime | None = None
+    # Month tables as (by month key, regular months by number), per variant for Long style. Short is always Unified.
+    _SHORT_MONTHS = (_UNIFIED_MONTH_NAME_SHORT, UNI_SHORT_BY_MONTH)
+    _LONG_MONTHS = {
+        Variant.UNI: (_UNIFIED_MONTH_NAME_LONG, UNI_LONG_BY_MONTH),
+        Variant.SWT: (_TERRITORIAN_MONTH_NAME_LONG, SWT_LONG_BY_MONTH),
+        Variant.AUS: (_AUSTRAL_MONTH_NAME_LONG, AUS_LONG_BY_MONTH),
+    }
+
+    # Instances carry only the converted date, no per-instance __dict__. All of these are set by `unify`.
+    __slots__ = ("_year_start", "unified_date", "swt_date", "austral_date", "gregorian_date")
+
+    _year_start: datetime  # datetime object containing first day of date's year
+    unified_date: UnifiedDateType
+    swt_date: UnifiedDateType
+    austral_date: UnifiedDateType
+    gregorian_date: str
 
     def __init__(self, user_date: str = None, style: str = "Long") -> None:
         """
@@ -104,20 +285,13 @@ class UnifiedDate:
         - user_date: Gregorian date in ISO 8601 format.
         - style - month representation style. Can be one of 'Long' or 'Short'
         """
-        # This will validate it is (more or less) correct.
-        user_date = (
-            datetime.strptime(user_date, "%Y-%m-%d").date().isoformat()
-            if user_date
-            else datetime.now().date().isoformat()
-        )
-        self.gregorian_date = user_date
         self.unified_date = self.unify(user_date, style)
 
     def __str__(self) -> str:
         "returns unified date in a nice format"
         return (
             f"{'Gregorian:':<15}{self.gregorian_date:>10} - "
-            f"{datetime.strptime(self.gregorian_date, '%Y-%m-%d').strftime('%A %d of %B, %Y')}\n"
+            f"{date.fromisoformat(self.gregorian_date).strftime('%A %d of %B, %Y')}\n"
             f"{'Unified ISO:':<15}{self.format_date(variant=Variant.UNI, style='ISO'):>10}\n"
             f"{'Unified Short:':<15}{self.format_date(Variant.UNI, style='Short')}\n"
             f"{'Unified Long:':<15}{self.format_date(Variant.UNI, 'Long')}\n"
@@ -127,7 +301,7 @@ class UnifiedDate:
         )
 
     def __repr__(self) -> str:
-        return self.__str__()
+        return f"UnifiedDate({self.gregorian_date!r})"
 
     def __check_variant(self, variant: Variant | str) -> Variant | str:
         """Check if value given is a valid Unified Calendar `Variant`.
@@ -148,12 +322,7 @@ class UnifiedDate:
         """
         if isinstance(variant, Variant):
             return variant
-        else:
-            for this in Variant:
-                if this.value.upper() == variant.upper().strip():
-                    return this
-
-        return variant
+        return _VARIANT_BY_NAME.get(variant.upper().strip(), variant)
 
     def __check_style(self, style: Style | str) -> Style | str:
         """Check if value given is a valid Unified `Style` of date representaion.
@@ -173,12 +342,7 @@ class UnifiedDate:
         """
         if isinstance(style, Style):
             return style
-        else:
-            for this in Style:
-                if this.value.upper() == style.upper().strip():
-                    return this
-
-        return style
+        return _STYLE_BY_NAME.get(style.upper().strip(), style)
 
     def format_date(self, variant: Variant = Variant.UNI, style: Style = Style.LONG) -> str:
         """
@@ -223,30 +387,7 @@ class UnifiedDate:
         if not date:
             raise InvalidUnifiedDateValue(date)
 
-        if style == Style.ISO:  # ISO 8601U "Unified ISO format"
-            return f"{date.year}-{date.month.numeric.quarter}{date.month.numeric.month}-{date.day.number:02}"
-
-        if date.weekday.regular:
-            date = UnifiedDateType(  # replace existing date tuple with requested format
-                weekday=date.weekday,
-                day=self.get_uniday(
-                    weekday=date.weekday,
-                    # invalid or unknown formats are also displayed as 'Long'
-                    style=Style.SHORT if style == Style.SHORT else Style.LONG,
-                ),
-                month=self.get_unimonth(weekday=date.weekday, variant=variant, style=style),
-                year=date.year,
-            )
-
-            if style == Style.SHORT:
-                _day_number = f"{date.day.number}"
-            else:
-                _day_number = f"{date.day.number:02}"  # For Style.LONG and .ISO
-
-            return f"{date.day.name} {_day_number}, {date.month.name} {date.year}"
-
-        # festive
-        return "{month} {year}".format(month=date.month.name, year=date.year)
+        return format_unidate(date, variant, style)
 
     def get_uniweek(self, day: int) -> UniWeek:
         """
@@ -261,21 +402,10 @@ class UnifiedDate:
             - number - numeric value for day of the week [1-6]
             - yearday - numeric value for day of the year [1-366]
         """
-        if day in FestiveDate.DAY:
-            return UniWeek(0, FestiveDate.DAY.index(day), day)
-
-        if 1 < day <= 91:
-            day -= 1
-        elif 92 < day <= 182:
-            day -= 2
-        elif 183 < day <= 273:
-            day -= 3
-        elif 274 < day <= 364:
-            day -= 4
-        else:
+        if not 1 <= day <= 366:
             raise InvalidUnifiedDateValue(f"Day out of range: {day!r}")
 
-        return UniWeek(1, (((day % 90) % 18) % 6) or 6, day)
+        return UNIWEEK_BY_YEARDAY[day]
 
     def get_uniday(self, weekday: UniWeek, style: Style = Style.LONG) -> UniDay:
         """
@@ -292,16 +422,16 @@ class UnifiedDate:
         - style: Calendar representation style. Styles are defined in `Style` Enum.
         """
         if weekday.regular == 0:
-            return UniDay(FestiveDate.SHORT_NAME[weekday.number], 0)
+            return FESTIVE_UNIDAY[weekday.number]
 
-        month_day = ((weekday.yearday % 90) % 18) or 18
-        if month_day < 1 or month_day > 18:
-            raise InvalidUnifiedDateValue(f"Invalid week tuple: {weekday!r}")
+        month_day = day_of_month(weekday.yearday)  # always within [1-18]
 
         if self.__check_style(style) == Style.LONG:
-            return UniDay("".join(k for k, v in self.WEEKDAY.items() if weekday.number in v), month_day)
+            # Shared instance; a week number outside [1-18] is still resolved the slow way (empty name).
+            day = UNIDAY_LONG_BY_NUMBERS.get((weekday.number, month_day))
+            return day or UniDay("".join(k for k, v in self.WEEKDAY.items() if weekday.number in v), month_day)
 
-        return UniDay(f"D{month_day}", month_day)
+        return UNIDAY_SHORT_BY_MONTHDAY[month_day]
 
     def get_unimonth(self, weekday: UniWeek, variant: Variant = Variant.UNI, style: Style = Style.LONG) -> UniMonth:
         """
@@ -316,27 +446,23 @@ class UnifiedDate:
         - style:
             Calendar representation style. Styles are defined in `Style` Enum.
         """
-        if weekday.regular:
-            # date is a regular day
-            month_number = int(trunc((weekday.yearday - 1) / 18.0)) + 1
-            if month_number > 20:
-                month_number = 20
-        else:
-            # date is a festivity. These months don't have number, only name.
-            month_number = FestiveDate.SHORT_NAME[weekday.number]  # use week day number as index
-
         if self.__check_style(style) == Style.SHORT:
             # Return short style only if explicitely requested, else Long.
-            return self._UNIFIED_MONTH_NAME_SHORT[month_number]
-
-        variant = self.__check_variant(variant)
+            months, months_by_number = self._SHORT_MONTHS
+        else:
+            # invalid or unknown variants are returned as "Unified"
+            months, months_by_number = self._LONG_MONTHS.get(
+                self.__check_variant(variant), self._LONG_MONTHS[Variant.UNI]
+            )
 
-        if variant == Variant.AUS:
-            return self._AUSTRAL_MONTH_NAME_LONG[month_number]
-        if variant == Variant.SWT:
-            return self._TERRITORIAN_MONTH_NAME_LONG[month_number]
-        # invalid or unknown variants are returned as "Unified"
-        return self._UNIFIED_MONTH_NAME_LONG[month_number]
+        if weekday.regular:
+            # date is a regular day
+            if weekday.yearday > 0:
+                return months_by_number[month_number(weekday.yearday)]
+            # Days before the first one are still resolved the slow way, rounding towards month 1 like `trunc()`.
+            return months[1 - (1 - weekday.yearday) // 18]
+        # date is a festivity. These months don't have number, only name.
+        return months[FESTIVE_NAMES_SHORT[weekday.number]]  # use week day number as index
 
     def unify(self, user_date: str = None, style: Style = Style.LONG) -> UnifiedDateType:
         """
@@ -363,116 +489,123 @@ class UnifiedDate:
         - Unified Date as UnifiedDateType {'weekday': UnifiedWeek, 'day': UnifiedDay, 'month': UnifiedMonth, 'year': year}
         """
         if not user_date:
-            user_date = datetime.now().date().isoformat()
-        self.gregorian_date = user_date
-
-        try:
-            udate = datetime.strptime(user_date, "%Y-%m-%d")
-        except ValueError:
-            msg = f"Date {user_date!r} must be in ISO-8601 format (YYYY-MM-DD)"
-            print(f"Sorry, {msg}")
-            raise ValueError(msg)
-
-        try:
-            self._year_start = datetime.strptime(f"{udate.year:04}-01-01", "%Y-%m-%d")
-        except ValueError as err:
-            msg = f"Unable to process date {udate!r}: {err}"
-            print(msg)
-            raise ValueError(msg)
-
-        days = udate.timetuple().tm_yday
-        year = udate.year + 5600
-        uni_weekday = self.get_uniweek(days)
-        uni_day = self.get_uniday(uni_weekday, style=style)
-
-        try:
-            self.unified_date = UnifiedDateType(
-                uni_weekday,
-                uni_day,
-                self.get_unimonth(weekday=uni_weekday, variant=Variant.UNI, style=style),
-                year,
-            )
-            self.swt_date = UnifiedDateType(
-                uni_weekday, uni_day, self.get_unimonth(weekday=uni_weekday, variant=Variant.SWT), year
-            )
-            self.austral_date = UnifiedDateType(
-                uni_weekday, uni_day, self.get_unimonth(weekday=uni_weekday, variant=Variant.AUS), year
-            )
-        except Exception as e:
-            print(f"Error {type(e)}:{e}. Values: weekday={uni_weekday}, day={uni_day}")
-            raise
-        else:
-            return self.unified_date
+            user_date = date.today().isoformat()
+
+        self.gregorian_date, (self._year_start, self.unified_date, self.swt_date, self.austral_date) = _unify_lenient(
+            user_date, self.__check_style(style)
+        )
+        return self.unified_date
+
+    def unify_batch(self, dates: Iterable[str], style: Style = Style.LONG) -> list[UnifiedDateType]:
+        """
+        Convert many Gregorian dates to Unified dates in one call.
+
+        Unlike `unify`, this doesn't change the dates stored in the instance, and only Unified dates are returned.
+
+        Parameters
+        ----------
+        - dates:
+            ISO 8601-formatted Gregorian dates (e.g. '2020-12-31'), accepted in the same formats as `unify`.
+        - style:
+            Calendar representation style. Styles are defined in `Style` Enum.
+
+        Returns
+        -------
+        - list of UnifiedDateType, in the same order as `dates`.
+        """
+        style = self.__check_style(style)
+        unified = []
+        for user_date in dates:
+            try:
+                unified.append(_unify_core(user_date, style)[1])
+            except ValueError:
+                unified.append(_unify_lenient(user_date, style)[1][1])
+        return unified
+
+    def unify_range(self, start: str, end: str, style: Style = Style.LONG) -> list[UnifiedDateType]:
+        """
+        Convert every Gregorian date from `start` to `end` (both included) to Unified dates.
+
+        Like `unify_batch`, this doesn't change the dates stored in the instance.
+
+        Parameters
+        ----------
+        - start, end:
+            ISO 8601-formatted Gregorian dates (e.g. '2020-12-31'), accepted in the same formats as `unify`. An empty
+            list is returned if `end` is before `start`.
+        - style:
+            Calendar representation style. Styles are defined in `Style` Enum.
+
+        Returns
+        -------
+        - list of UnifiedDateType, one per day.
+        """
+        first, last = _parse_isodate(start).toordinal(), _parse_isodate(end).toordinal()
+        return self.unify_batch((date.fromordinal(day).isoformat() for day in range(first, last + 1)), style)
 
     def print_calendar(self) -> None:  # pragma: no cover
         "Print entire year calendar for current Gregorian date"
 
-        print(f"{'Gregorian':12} {'Unified':12} {'Long':36} {'Territorian':20} Austral")
-        _save_date = self.gregorian_date
-        year_start = self._year_start
+        # Lines are collected and written at once, instead of one print() per line.
+        lines = [f"{'Gregorian':12} {'Unified':12} {'Long':36} {'Territorian':20} Austral"]
+        festive_rule, month_rule = f"\n{'=' * 104}", "-" * 104
+        unify, fmt = _unify_core, format_unidate  # local aliases for the loop
         prev = None
 
-        for d in range(0, 366):
-            self.gregorian_date = (year_start + timedelta(days=d)).date().isoformat()
-            self.unify(self.gregorian_date)
-            iso = self.format_date("Unified", "ISO")
-            uni = self.format_date("Unified")
-            swt = self.swt_date.month.name
-            aus = self.austral_date.month.name
+        # Rows come straight from the cached, stateless converters; the instance's own date is left untouched.
+        for d, gregorian_date in enumerate(_year_isodates(self._year_start.year)):
+            _, unified_date, swt_date, austral_date = unify(gregorian_date, Style.LONG)
+            (regular, _, _), _, (month_name, (quarter, _)), _ = unified_date
 
-            date = f"{self.gregorian_date:12} {iso:12} {uni:36} {swt:20} {aus}"
+            row = (
+                f"{gregorian_date:12} {fmt(unified_date, Variant.UNI, Style.ISO):12} "
+                f"{fmt(unified_date, Variant.UNI, Style.LONG):36} {swt_date.month.name:20} {austral_date.month.name}"
+            )
 
-            if self.unified_date.weekday.regular == 0:
-                print(f"\n{'=' * 104}")
-            elif self.unified_date.month.name != prev:
-                print(f"{'-' * 104}")
+            if regular == 0:
+                lines.append(festive_rule)
+            elif month_name != prev:
+                lines.append(month_rule)
 
-            if d < 365:
-                print(date)
-            elif self.unified_date.month.numeric.quarter == 6:
-                print(date)
+            if d < 365 or quarter == 6:
+                lines.append(row)
 
-            prev = self.unified_date.month.name
+            prev = month_name
 
-        self.unify(_save_date)  # restore last used date.
+        print("\n".join(lines))
 
     def print_festive(self) -> None:  # pragma: no cover
         """
         Print gregorian dates corresponding to unified festive dates
         in the year of current Gregorian date.
         """
-        from copy import deepcopy
+        year = self._year_start.year
+        year_dates = _year_isodates(year)
+        year_length = 365 + LEAP_YEARS[year]  # Leap day only in leap years
 
-        year_start = deepcopy(self._year_start)
-        _save_date = self.gregorian_date
-
-        for d in self.FESTIVE_DAYS:
-            self.gregorian_date = (year_start + timedelta(days=d - 1)).date().isoformat()
-            self.unify(self.gregorian_date)
-            print(f"{'_' * 50}\n{self}")
-
-        self.unify(_save_date)
+        # Each festive date is shown by its own instance; conversions are cached, and this one is left untouched.
+        print("\n".join(f"{'_' * 50}\n{type(self)(year_dates[d - 1])}" for d in FESTIVE_DAYS if d <= year_length))
 
     def print_month(self) -> None:  # pragma: no cover
         "Print unified dates for the whole month corresponding to current Gregorian date."
         from calendar import monthrange
 
-        print(f"\nMonth for Gregorian date {self.gregorian_date}\n{'^' * 40}\n")
+        lines = [f"\nMonth for Gregorian date {self.gregorian_date}\n{'^' * 40}\n"]
 
         _save_date = self.gregorian_date
-        gd = datetime.strptime(self.gregorian_date, "%Y-%m-%d")
-        last_day = monthrange(gd.year, gd.month)[1]
+        gd = date.fromisoformat(self.gregorian_date)
+        month_dates = (date(gd.year, gd.month, d).isoformat() for d in range(1, monthrange(gd.year, gd.month)[1] + 1))
 
-        for d in range(1, last_day + 1):
-            self.gregorian_date = datetime.strptime(f"{gd.year}-{gd.month:02}-{d:02}", "%Y-%m-%d").date().isoformat()
-            self.unify(self.gregorian_date)
+        for gregorian_date in month_dates:
+            self.unify(gregorian_date)
             if self.unified_date.month.numeric.month == 0:
-                print(f'{self.gregorian_date}\t{self.format_date("Unified", "Long")}\n{"-" * 40}')
+                lines.append(f'{self.gregorian_date}\t{self.format_date("Unified", "Long")}\n{"-" * 40}')
             elif self.unified_date.day.number == 1 and self.unified_date.month.numeric.month > 1:
-                print(f'\n{self.gregorian_date}\t{self.format_date("Unified", "Long")}')
+                lines.append(f'\n{self.gregorian_date}\t{self.format_date("Unified", "Long")}')
             else:
-                print(f'{self.gregorian_date}\t{self.format_date("Unified", "Long")}')
+                lines.append(f'{self.gregorian_date}\t{self.format_date("Unified", "Long")}')
 
+        print("\n".join(lines))
         self.unify(_save_date)
 
     def reverse_year(self, unified_year: int) -> int:
@@ -485,66 +618,55 @@ class UnifiedDate:
         -------
         - numeric Gregorian year
         """
-        if unified_year is None:
-            raise InvalidUnifiedDateValue("Invalid year value: None")
-
-        try:
-            unified_year = int(unified_year)
-            if unified_year >= 0:
-                return unified_year - 5600
-            raise InvalidUnifiedDateValue("Cannot convert Unified prehistoric dates.")
-        except ValueError:
-            raise InvalidUnifiedDateValue(f"{unified_year!r} - Not a valid year.")
-        return None
-
-    def reverse_unidate(self, u_date: str) -> datetime:
+        return _reverse_year(unified_year)
+
+    def reverse_unidate(self, u_date: str, update_state: bool = True) -> datetime:
         """
         Convert Unified date string to Gregorian date.
 
         Parameters
         ==========
         - u_date: ISO 8601U-formatted Unified Date string.
+        - update_state: if True (default), also unify the instance to the resulting date. Pass False to leave the
+            instance untouched.
 
         Returns:
         ========
         - datetime object.
         """
-        user_date = u_date
-        try:
-            _year, _quarter_month, _day = user_date.split("-")
-            _year = int(_year)
-            _quarter = int(_quarter_month[0])
-            _month = int(_quarter_month[1])
-            _day = int(_day)
-        except AttributeError as err:
-            print(f"Expected a string: {err}")
-            raise
-        except IndexError as err:
-            print(f"Quarter or Month seem to be out of range: {user_date}")
-            raise
-        except ValueError as err:
-            print(f"Expected an ISO-8601U (YYYY-QM-DD) date: {user_date}: {err}")
-            raise
-
-        _gyear = self.reverse_year(_year)  # Gregorian year
-
-        if _month == 0:
-            DAYNUMS = [None, 1, 92, 183, 274, 365, 366]
-            if _quarter < 1 or _quarter > 6:
-                raise InvalidUnifiedDateValue(f"Not an ISO-8601U date: {user_date!r}")
-            _gday = datetime.strptime(f"{_gyear}-{DAYNUMS[_quarter]:03}", "%Y-%j")
-        else:
-            _julian = (90 * (_quarter - 1)) + (18 * (_month - 1)) + _day
-            _gday = datetime.strptime(f"{_gyear}-{_julian:003}", "%Y-%j") + timedelta(days=_quarter)
-
-        self.unify(_gday.date().isoformat())
+        _gday = _reverse_unidate_core(u_date)
+        if update_state:
+            self.unify(_gday.date().isoformat())
         return _gday
 
+    def reverse_unidate_batch(self, u_dates: Iterable[str]) -> list[datetime]:
+        """
+        Convert many Unified date strings to Gregorian dates in one call.
+
+        Unlike `reverse_unidate`, this doesn't change the dates stored in the instance.
+
+        Parameters
+        ----------
+        - u_dates:
+            ISO 8601U-formatted Unified Date strings.
+
+        Returns
+        -------
+        - list of datetime objects, in the same order as `u_dates`.
+        """
+        return [_reverse_unidate_core(u_date) for u_date in u_dates]
+
     @classmethod
     def today(cls, style="Long"):
         "Create a UnifiedDate instance from today's date"
         return cls(datetime.now().date().isoformat(), style)
 
+    @staticmethod
+    def clear_cache() -> None:
+        "Empty the caches of converted and formatted dates shared by all instances"
+        for cached in (_unify_core, _reverse_unidate_core, _year_isodates, format_unidate):
+            cached.cache_clear()
+
 
 def startup():
     "Display today's date in Unidate standard"
@@ -554,5 +676,3 @@ def startup():
 
 if __name__ == "__main__":
     startup()
-else:
-    startup()